@@ -1,12 +1,5 @@
-# Import stress/strain profiles
-from concreteproperties.stress_strain_profile import (
-    ConcreteLinearNoTension,
-    RectangularStressBlock,
-    SteelElasticPlastic,
-)
-
-# Import materials
-from concreteproperties.material import Concrete, SteelBar
+# concreteproperties is imported inside the material functions so that
+# modules using only the ACI 318 calculations load quickly.
 
 
 def calculate_beta_1(fpc: float) -> float:
@@ -54,6 +47,11 @@ def create_concrete_ACI318(fpc: float, wc: float = 0.15, eps_cu: float = 0.003):
     fpc: f'c in ksi
     wc: unit weight of concrete in kcf
     eps_cu: ultimate crushing strain of concrete"""
+    from concreteproperties.material import Concrete
+    from concreteproperties.stress_strain_profile import (
+        ConcreteLinearNoTension,
+        RectangularStressBlock,
+    )
 
     Ec = calc_concrete_elastic_modulus(fpc, wc)
     # only takes compression and stress is linear
@@ -92,6 +90,9 @@ def create_rebar_ACI318(
     eps_fracture: fracture strain of rebar (MADE UP VALUE.. CONFIRM WITH SR OR MA)
     density: unit weight of steel in kcf
     """
+    from concreteproperties.material import SteelBar
+    from concreteproperties.stress_strain_profile import SteelElasticPlastic
+
     # Rebar stress-strain profile
     steel_elastic_plastic = SteelElasticPlastic(
         yield_strength=fy, elastic_modulus=Es, fracture_strain=eps_fracture
@@ -0,0 +1,35 @@
+import pytest
+
+import column_stacks as cs
+import ram_column_schedule as rcs
+import synthetic_ram_export as sre
+
+
+@pytest.fixture(scope="module")
+def column_data():
+    # 50 stories x 15 x 15 grid lines = 11,250 columns
+    csv_text = sre.generate_RAM_column_design_csv(50, 15, 15, 6, 4)
+    return rcs.extract_RAM_conc_column_data(
+        rcs.split_RAM_csv_lines(csv_text.splitlines())
+    )
+
+
+@pytest.fixture(scope="module")
+def stacks(column_data):
+    return cs.build_column_stacks(column_data)
+
+
+def bench_build_column_stacks(benchmark, column_data):
+    benchmark(cs.build_column_stacks, column_data)
+
+
+def bench_calc_splice_points(benchmark, stacks):
+    benchmark(cs.calc_splice_points, stacks)
+
+
+def bench_calc_vert_bar_weights(benchmark, stacks):
+    benchmark(cs.calc_vert_bar_weights, stacks)
+
+
+def bench_summarize_column_stacks(benchmark, stacks):
+    benchmark(cs.summarize_column_stacks, stacks)
@@ -0,0 +1,68 @@
+import random
+
+import numpy as np
+import pytest
+
+import conc_columns
+import interaction_library
+import rebar
+
+
+@pytest.fixture(scope="module", params=[100, 10_000], ids=["100", "10k"])
+def tensile_strains(request):
+    rng = random.Random(0)
+    return [rng.uniform(0, 0.01) for _ in range(request.param)]
+
+
+def bench_calc_phi(benchmark, tensile_strains):
+    benchmark(conc_columns.calc_phi, tensile_strains)
+
+
+def bench_calc_Pn(benchmark):
+    rng = random.Random(0)
+    columns = [
+        (rng.choice([12, 16, 20, 24]), rng.choice([12, 16, 20, 24, 30]))
+        for _ in range(10_000)
+    ]
+
+    def calc_all():
+        return [conc_columns.calc_Pn(b, h, 8, 12, 0.79) for b, h in columns]
+
+    benchmark(calc_all)
+
+
+def bench_generate_bar_coordinates(benchmark):
+    layouts = [
+        (b, h, nb, nh)
+        for b, h in [(14, 24), (24, 24), (36, 36)]
+        for nb, nh in [(2, 2), (3, 5), (6, 6)]
+    ]
+
+    def generate_all():
+        return [
+            conc_columns.generate_bar_coordinates(b, h, nb, nh)
+            for b, h, nb, nh in layouts
+        ]
+
+    benchmark(generate_all)
+
+
+def build_column_section(b, h, fpc, bar_size, n_bars_b, n_bars_h, fy=60):
+    edge_dist = 1.5 + 0.375 + rebar.REBAR[bar_size]["d_bar"] / 2
+    return interaction_library.create_column_section(
+        b, h, fpc, fy, rebar.REBAR[bar_size]["As"], n_bars_b, n_bars_h, edge_dist
+    )
+
+
+def bench_build_column_section(benchmark):
+    benchmark(build_column_section, 14, 24, 6, "#8", 3, 4)
+
+
+def bench_moment_interaction_diagram(benchmark):
+    conc_sec = build_column_section(14, 24, 6, "#8", 3, 4)
+    benchmark.pedantic(
+        conc_sec.moment_interaction_diagram,
+        kwargs={"theta": np.pi / 2, "n_points": 100, "progress_bar": False},
+        rounds=3,
+        iterations=1,
+    )
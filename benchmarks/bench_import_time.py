@@ -0,0 +1,71 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+# Code run in a fresh interpreter for each import path
+IMPORT_PATHS = {
+    "parse_only": (
+        "import ram_column_schedule as rcs\n"
+        "rcs.extract_RAM_conc_column_data(rcs.split_RAM_csv_lines([]))\n"
+    ),
+    # create_full_RAM_concrete_column_schedule() also imports pandas
+    "schedule": "import ram_column_schedule\nimport pandas\n",
+    "full_analysis": (
+        "import ram_column_schedule, conc_columns, rebar, aci_318_14_materials\n"
+        "import numpy, pandas, matplotlib.pyplot\n"
+        "from sectionproperties.pre.library.primitive_sections import rectangular_section\n"
+        "from concreteproperties.pre import add_bar_rectangular_array\n"
+        "from concreteproperties.concrete_section import ConcreteSection\n"
+        "aci_318_14_materials.create_concrete_ACI318(5)\n"
+        "aci_318_14_materials.create_rebar_ACI318(60)\n"
+    ),
+}
+
+
+def import_time(code: str) -> int:
+    """
+    Returns the total import time in microseconds reported by
+    python -X importtime for the given code, excluding interpreter startup.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    started = False
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # only top level imports are counted, nested ones are in cumulative
+        if name.startswith("  "):
+            continue
+        if started:
+            total += int(cumulative)
+        # everything up to site is interpreter startup
+        started = started or name.strip() == "site"
+    return total
+
+
+@pytest.fixture(params=IMPORT_PATHS.keys())
+def import_path(request):
+    return request.param
+
+
+def bench_import_time(benchmark, import_path):
+    code = IMPORT_PATHS[import_path]
+    benchmark.extra_info["importtime_us"] = import_time(code)
+    benchmark.pedantic(
+        subprocess.run,
+        args=([sys.executable, "-c", code],),
+        kwargs={"cwd": REPO_DIR, "check": True},
+        rounds=5,
+        iterations=1,
+    )
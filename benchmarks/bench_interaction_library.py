@@ -0,0 +1,32 @@
+import pytest
+
+import interaction_library as il
+import ram_column_schedule as rcs
+import synthetic_ram_export as sre
+
+
+@pytest.fixture(scope="module")
+def column_data():
+    # 50 stories x 15 x 15 grid lines = 11,250 columns
+    csv_text = sre.generate_RAM_column_design_csv(50, 15, 15, 6, 4)
+    return rcs.extract_RAM_conc_column_data(
+        rcs.split_RAM_csv_lines(csv_text.splitlines())
+    )
+
+
+def bench_load_interaction_library(benchmark):
+    benchmark(il.load_interaction_library)
+
+
+def bench_screen_columns(benchmark, column_data):
+    library = il.load_interaction_library()
+    benchmark(il.screen_columns, library, column_data)
+
+
+def bench_check_column(benchmark):
+    benchmark.pedantic(
+        il.check_column,
+        args=(16, 16, 6, 16, "#6", 552.9, 480, 180),
+        rounds=3,
+        iterations=1,
+    )
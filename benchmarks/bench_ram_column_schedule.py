@@ -0,0 +1,34 @@
+import pytest
+
+import ram_column_schedule as rcs
+import synthetic_ram_export as sre
+
+# (n_stories, n_grid_x, n_grid_y, n_sizes, n_load_combos)
+BUILDINGS = {
+    "small": (5, 3, 3, 2, 2),
+    "medium": (20, 6, 6, 4, 4),
+    "large": (40, 16, 16, 6, 7),
+}
+
+
+@pytest.fixture(scope="module", params=BUILDINGS.values(), ids=BUILDINGS.keys())
+def csv_lines(request):
+    n_stories, n_grid_x, n_grid_y, n_sizes, n_load_combos = request.param
+    csv_text = sre.generate_RAM_column_design_csv(
+        n_stories, n_grid_x, n_grid_y, n_sizes, n_load_combos
+    )
+    return csv_text.splitlines(keepends=True)
+
+
+def bench_split_RAM_csv_lines(benchmark, csv_lines):
+    benchmark(rcs.split_RAM_csv_lines, csv_lines)
+
+
+def bench_extract_RAM_conc_column_data(benchmark, csv_lines):
+    raw_data = rcs.split_RAM_csv_lines(csv_lines)
+    benchmark(rcs.extract_RAM_conc_column_data, raw_data)
+
+
+def bench_create_full_RAM_concrete_column_schedule(benchmark, csv_lines):
+    column_data = rcs.extract_RAM_conc_column_data(rcs.split_RAM_csv_lines(csv_lines))
+    benchmark(rcs.create_full_RAM_concrete_column_schedule, column_data)
@@ -0,0 +1,38 @@
+import pytest
+
+import ram_column_schedule as rcs
+import rebar_takeoff as rt
+import synthetic_ram_export as sre
+
+
+def extract_column_data(seed):
+    # 50 stories x 15 x 15 grid lines = 11,250 columns
+    csv_text = sre.generate_RAM_column_design_csv(50, 15, 15, 6, 4, seed=seed)
+    return rcs.extract_RAM_conc_column_data(
+        rcs.split_RAM_csv_lines(csv_text.splitlines())
+    )
+
+
+@pytest.fixture(scope="module")
+def column_data():
+    return extract_column_data(seed=0)
+
+
+@pytest.fixture(scope="module")
+def story_heights(column_data):
+    return {story: 11.0 for story in column_data["level"]}
+
+
+def bench_calc_rebar_takeoff(benchmark, column_data, story_heights):
+    benchmark(rt.calc_rebar_takeoff, column_data, story_heights)
+
+
+def bench_takeoff_by_story(benchmark, column_data, story_heights):
+    takeoff = rt.calc_rebar_takeoff(column_data, story_heights)
+    benchmark(rt.takeoff_by_story, takeoff)
+
+
+def bench_diff_takeoffs(benchmark, column_data, story_heights):
+    old = rt.calc_rebar_takeoff(extract_column_data(seed=1), story_heights)
+    new = rt.calc_rebar_takeoff(column_data, story_heights)
+    benchmark(rt.diff_takeoffs, old, new)
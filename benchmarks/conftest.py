@@ -0,0 +1,16 @@
+import pytest
+from pytest_benchmark.utils import parse_compare_fail
+
+# Regression thresholds applied when comparing against a saved baseline
+# with --benchmark-compare, unless --benchmark-compare-fail is given.
+REGRESSION_THRESHOLDS = ["mean:15%", "min:25%"]
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    if config.getoption("benchmark_compare") and not config.getoption(
+        "benchmark_compare_fail"
+    ):
+        config.option.benchmark_compare_fail = [
+            parse_compare_fail(threshold) for threshold in REGRESSION_THRESHOLDS
+        ]
@@ -0,0 +1,234 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+import rebar
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+BAR_SIZES = list(rebar.REBAR)
+BAR_AREA = np.array([rebar.REBAR[bs]["As"] for bs in BAR_SIZES])
+BAR_DIA = np.array([rebar.REBAR[bs]["d_bar"] for bs in BAR_SIZES])
+BAR_PLF = np.array([rebar.REBAR[bs]["plf"] for bs in BAR_SIZES])
+
+
+@dataclass
+class ColumnStacks:
+    """
+    Columns of a building grouped into stacks, one per grid location, with
+    the stories ordered from the bottom of the building to the top.
+
+    Every array except grid_locs and stories has the shape
+    (len(grid_locs), len(stories)). Where a grid location has no column on a
+    story, column_idx is -1, bar_idx is -1 and the float values are NaN.
+    """
+
+    grid_locs: np.ndarray
+    stories: np.ndarray
+    column_idx: np.ndarray  # index into the extracted column data
+    b: np.ndarray  # in
+    h: np.ndarray  # in
+    fpc: np.ndarray  # ksi
+    n_bars: np.ndarray
+    bar_idx: np.ndarray  # index into BAR_SIZES
+    length: np.ndarray  # ft
+
+    @property
+    def exists(self) -> np.ndarray:
+        return self.column_idx >= 0
+
+
+def parse_sizes(sizes: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns arrays of b and h in inches from RAM size strings (e.g. '14x24').
+    """
+    dims = np.array([size.split("x") for size in sizes], dtype=float).reshape(-1, 2)
+    return dims[:, 0], dims[:, 1]
+
+
+def parse_rebar(rebars: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns arrays of the number of bars and the index of the bar size in
+    BAR_SIZES from RAM longitudinal rebar strings (e.g. '12-#8').
+    """
+    bar_lookup = {bs: idx for idx, bs in enumerate(BAR_SIZES)}
+    n_bars = np.array([int(rb.split("-")[0]) for rb in rebars], dtype=int)
+    bar_idx = np.array([bar_lookup[rb.split("-")[-1]] for rb in rebars], dtype=int)
+    return n_bars, bar_idx
+
+
+def build_column_stacks(
+    column_data: dict[str, list[str]],
+    top_down: bool = True,
+    story_heights: dict[str, float] | None = None,
+) -> ColumnStacks:
+    """
+    Returns the ColumnStacks for the dictionary created from the
+    extract_RAM_conc_column_data() function.
+
+    Args:
+    column_data: extracted RAM column design data
+    top_down: True if the levels in column_data are listed from the top of
+        the building down, as in the RAM "Column Design" csv
+    story_heights: floor to floor height in ft of each story, used as the
+        column length instead of the RAM unbraced length
+    """
+    levels = np.asarray(column_data["level"])
+    grid_locs = np.asarray(column_data["grid_loc"])
+
+    # stories in order of first appearance, then bottom to top
+    stories, first_seen, story_of_col = np.unique(
+        levels, return_index=True, return_inverse=True
+    )
+    story_order = np.argsort(first_seen)
+    if top_down:
+        story_order = story_order[::-1]
+    story_rank = np.empty_like(story_order)
+    story_rank[story_order] = np.arange(len(story_order))
+
+    grids, grid_first_seen, grid_of_col = np.unique(
+        grid_locs, return_index=True, return_inverse=True
+    )
+    grid_order = np.argsort(grid_first_seen)
+    grid_rank = np.empty_like(grid_order)
+    grid_rank[grid_order] = np.arange(len(grid_order))
+
+    shape = (len(grids), len(stories))
+    rows = grid_rank[grid_of_col]
+    cols = story_rank[story_of_col]
+    column_idx = np.full(shape, -1, dtype=int)
+    column_idx[rows, cols] = np.arange(len(levels))
+
+    b, h = parse_sizes(column_data["size"])
+    n_bars, bar_idx = parse_rebar(column_data["rebar"])
+    fpc = np.asarray(column_data["fpc"], dtype=float)
+    if story_heights is None:
+        length = np.asarray(column_data["lux"], dtype=float)
+    else:
+        heights = np.array([story_heights[story] for story in stories], dtype=float)
+        length = heights[story_of_col]
+
+    def to_grid(values: np.ndarray, fill) -> np.ndarray:
+        arr = np.full(shape, fill, dtype=np.result_type(values, type(fill)))
+        arr[rows, cols] = values
+        return arr
+
+    return ColumnStacks(
+        grid_locs=grids[grid_order],
+        stories=stories[story_order],
+        column_idx=column_idx,
+        b=to_grid(b, np.nan),
+        h=to_grid(h, np.nan),
+        fpc=to_grid(fpc, np.nan),
+        n_bars=to_grid(n_bars, 0),
+        bar_idx=to_grid(bar_idx, -1),
+        length=to_grid(length, np.nan),
+    )
+
+
+def calc_transitions(stacks: ColumnStacks) -> dict[str, np.ndarray]:
+    """
+    Returns boolean arrays that are True where the column size, rebar or f'c
+    of a column differs from the column directly below it. The bottom story
+    and columns without a column below are always False.
+    """
+    below = stacks.exists[:, :-1] & stacks.exists[:, 1:]
+
+    def changed(values: np.ndarray) -> np.ndarray:
+        out = np.zeros(values.shape, dtype=bool)
+        out[:, 1:] = below & (values[:, 1:] != values[:, :-1])
+        return out
+
+    return {
+        "size": changed(stacks.b) | changed(stacks.h),
+        "rebar": changed(stacks.n_bars) | changed(stacks.bar_idx),
+        "fpc": changed(stacks.fpc),
+    }
+
+
+def calc_compression_lap_length(d_bar: np.ndarray, fy: float = 60) -> np.ndarray:
+    """
+    Returns the compression lap splice length in inches of deformed bars per
+    ACI 318-14 25.5.5.1.
+
+    Args:
+    d_bar: bar diameter in inches
+    fy: yield stress of rebar in ksi
+    """
+    if fy <= 60:
+        lap = 0.0005 * fy * 1000 * d_bar
+    else:
+        lap = (0.0009 * fy * 1000 - 24) * d_bar
+    return np.maximum(lap, 12.0)
+
+
+def calc_splice_points(stacks: ColumnStacks, splice_every: int = 2) -> np.ndarray:
+    """
+    Returns a boolean array that is True where the vertical bars are spliced
+    at the base of a column.
+
+    Bars are spliced where the column size or rebar changes and otherwise
+    every splice_every stories up the stack.
+    """
+    transitions = calc_transitions(stacks)
+    forced = transitions["size"] | transitions["rebar"]
+    continues = np.zeros(stacks.column_idx.shape, dtype=bool)
+    continues[:, 1:] = stacks.exists[:, :-1] & stacks.exists[:, 1:]
+
+    splices = np.zeros(stacks.column_idx.shape, dtype=bool)
+    stories_since = np.zeros(len(stacks.grid_locs), dtype=int)
+    for story in range(1, len(stacks.stories)):
+        stories_since += 1
+        splice = continues[:, story] & (
+            forced[:, story] | (stories_since >= splice_every)
+        )
+        splices[:, story] = splice
+        stories_since[splice | ~continues[:, story]] = 0
+    return splices
+
+
+def calc_vert_bar_weights(
+    stacks: ColumnStacks, splices: np.ndarray | None = None, fy: float = 60
+) -> np.ndarray:
+    """
+    Returns the weight in lbs of the vertical bars of every column, including
+    the compression lap splice at the base of the column where it is spliced
+    to the bars below.
+    """
+    if splices is None:
+        splices = calc_splice_points(stacks)
+    bar_idx = np.where(stacks.exists, stacks.bar_idx, 0)
+    plf = np.where(stacks.exists, BAR_PLF[bar_idx], 0.0)
+    lap = calc_compression_lap_length(BAR_DIA[bar_idx], fy) / 12  # ft
+    length = np.where(stacks.exists, stacks.length, 0.0) + np.where(splices, lap, 0.0)
+    return stacks.n_bars * plf * length
+
+
+def summarize_column_stacks(
+    stacks: ColumnStacks, splice_every: int = 2, fy: float = 60
+) -> "pd.DataFrame":
+    """
+    Returns a DataFrame with one row per column stack giving the number of
+    stories, size, rebar and f'c transitions, splices and the vertical bar
+    weight in lbs.
+    """
+    import pandas as pd
+
+    transitions = calc_transitions(stacks)
+    splices = calc_splice_points(stacks, splice_every)
+    weights = calc_vert_bar_weights(stacks, splices, fy)
+    summary_df = pd.DataFrame(
+        {
+            "stories": stacks.exists.sum(axis=1),
+            "size_changes": transitions["size"].sum(axis=1),
+            "rebar_changes": transitions["rebar"].sum(axis=1),
+            "fpc_changes": transitions["fpc"].sum(axis=1),
+            "splices": splices.sum(axis=1),
+            "vert_bar_weight": weights.sum(axis=1),
+        },
+        index=pd.Index(stacks.grid_locs, name="grid_loc"),
+    )
+    return summary_df
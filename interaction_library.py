@@ -0,0 +1,512 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+import aci_318_14_materials
+import column_stacks as cs
+import conc_columns
+import rebar_takeoff
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from concreteproperties.concrete_section import ConcreteSection
+
+
+# Default grid of the library
+RHOS = (0.01, 0.015, 0.02, 0.03, 0.04)
+GAMMAS = (0.6, 0.7, 0.8, 0.9)
+FPCS = (4.0, 5.0, 6.0, 8.0, 10.0)  # ksi
+FYS = (60.0, 80.0)  # ksi
+
+# Normalized axial load levels, phi*Pn / (f'c * Ag), the curves are stored at
+P_LEVELS = np.linspace(-0.8, 1.0, 91)
+
+H_REF = 24.0  # in, depth and width of the square section the library uses
+N_BARS_PER_FACE_REF = 4
+
+DEFAULT_LIBRARY_FILE = str(Path(__file__).with_name("interaction_library.npz"))
+
+
+@dataclass
+class InteractionLibrary:
+    """
+    Normalized, factored moment interaction curves of tied rectangular
+    columns with bars on all four faces.
+
+    m_n[i, j, k, l, :] is phi*Mn / (f'c * Ag * h) at the axial loads
+    P_LEVELS = phi*Pn / (f'c * Ag) for rhos[i], gammas[j], fpcs[k] and
+    fys[l], where gamma is the distance between the outer bar centres
+    divided by the column dimension h. m_n is NaN above and below the
+    curve. The
+    curves are not limited to the ACI 318-14 22.4.2 maximum axial strength,
+    which is checked separately for each column.
+    """
+
+    rhos: np.ndarray
+    gammas: np.ndarray
+    fpcs: np.ndarray
+    fys: np.ndarray
+    p_levels: np.ndarray
+    m_n: np.ndarray
+
+
+def create_column_section(
+    b: float,
+    h: float,
+    fpc: float,
+    fy: float,
+    bar_area: float,
+    n_bars_b: int,
+    n_bars_h: int,
+    edge_dist: float,
+) -> "ConcreteSection":
+    """
+    Returns a concreteproperties ConcreteSection of a rectangular column
+    with bars evenly spaced along each face.
+
+    Args:
+    b: width of column (x-direction) in inches
+    h: depth of column (y-direction) in inches
+    fpc: f'c in ksi
+    fy: yield stress of rebar in ksi
+    bar_area: area of one of the vertical rebar in sq. inches
+    n_bars_b: number of bars along b, including the corners
+    n_bars_h: number of bars along h, including the corners
+    edge_dist: distance from the column face to the centre of the bars
+    """
+    from sectionproperties.pre.library.primitive_sections import rectangular_section
+    from concreteproperties.pre import add_bar_rectangular_array
+    from concreteproperties.concrete_section import ConcreteSection
+
+    conc = aci_318_14_materials.create_concrete_ACI318(fpc)
+    steel = aci_318_14_materials.create_rebar_ACI318(fy)
+
+    col_geom = rectangular_section(h, b, conc).align_center()
+    col_geom = add_bar_rectangular_array(
+        col_geom,
+        bar_area,
+        steel,
+        n_bars_b,
+        (b - 2 * edge_dist) / (n_bars_b - 1),
+        n_bars_h,
+        (h - 2 * edge_dist) / (n_bars_h - 1),
+        (-b / 2 + edge_dist, -h / 2 + edge_dist),
+        exterior_only=True,
+    )
+    return ConcreteSection(col_geom)
+
+
+def clear_split_lines(
+    conc_sec: "ConcreteSection",
+    d_n: np.ndarray,
+    theta: float = 0,
+    tol: float = 1e-3,
+) -> np.ndarray:
+    """
+    Returns the neutral axis depths d_n, each increased in steps of tol
+    until none of the lines concreteproperties splits the concrete at
+    (the stress block edges) pass within tol of a vertex of the concrete
+    geometry.
+
+    A split line through, or a hair away from, a vertex of a bar hole
+    leaves a degenerate segment that can crash the mesher (triangle) with
+    a segfault, which cannot be caught.
+
+    Args:
+    conc_sec: section to analyze
+    d_n: neutral axis depths from the extreme compression fibre in inches
+    theta: angle of the neutral axis, 0 for bending about x
+    tol: clearance in inches
+    """
+    from concreteproperties import utils
+
+    eps_u = conc_sec.gross_properties.conc_ultimate_strain
+    # depth of each split line from the extreme fibre per unit d_n
+    split_ratios = []
+    for geom in conc_sec.concrete_geometries:
+        strains = geom.material.ultimate_stress_strain_profile.get_unique_strains()
+        split_ratios.extend(1 - strain / eps_u for strain in strains[1:-1])
+    split_ratios = np.array(split_ratios)
+    points = np.array(conc_sec.compound_geometry.points)
+    _, v = utils.global_to_local(theta, points[:, 0], points[:, 1])
+    vertex_depths = np.unique(v.max() - v)
+
+    d_n = np.array(d_n, dtype=float)
+    for idx, depth in enumerate(d_n):
+        if not np.isfinite(depth) or len(split_ratios) == 0:
+            continue
+        for _ in range(100):
+            split_depths = depth * split_ratios
+            clearance = np.abs(split_depths[:, None] - vertex_depths[None, :]).min()
+            if clearance >= tol:
+                break
+            depth += tol
+        d_n[idx] = depth
+    return d_n
+
+
+def calc_factored_interaction(
+    conc_sec: "ConcreteSection",
+    h: float,
+    edge_dist: float,
+    fy: float,
+    theta: float = 0,
+    n_points: int = 40,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns arrays of phi*Pn (kips) and phi*Mn (kip-in) of the moment
+    interaction diagram of conc_sec about the axis at theta, with phi from
+    the net tensile strain in the extreme tension bars per ACI 318-14.
+
+    The diagram runs from pure compression through n_points neutral axis
+    depths from h to pure tension, plus the balanced and tension controlled
+    points, with the depths moved clear of the bar vertices by
+    clear_split_lines().
+
+    Args:
+    conc_sec: section to analyze
+    h: depth of the section in the direction of bending in inches
+    edge_dist: distance from the column face to the centre of the bars
+    fy: yield stress of rebar in ksi
+    theta: angle of the neutral axis, 0 for bending about x
+    n_points: number of points on the interaction diagram
+    """
+    from concreteproperties import results as res
+
+    d_t = h - edge_dist
+    eps_ty = fy / 29000
+    d_n_controls = [
+        d_t * 0.003 / (0.003 + eps_ty),  # balanced
+        d_t * 0.003 / (0.003 + 0.005),  # tension controlled
+    ]
+    d_n = np.concatenate([[np.inf], np.linspace(h, 1e-6, n_points), d_n_controls])
+    d_n = np.sort(clear_split_lines(conc_sec, d_n, theta))[::-1]
+
+    results = [
+        conc_sec.calculate_ultimate_section_actions(
+            d_n=depth, ultimate_results=res.UltimateBendingResults(theta=theta)
+        )
+        for depth in d_n
+    ]
+    n = np.array([result.n for result in results])
+    m = np.array([abs(result.m_xy) for result in results])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        eps_t = np.where(
+            np.isfinite(d_n) & (d_n > 0), 0.003 * (d_t - d_n) / d_n, -0.003
+        )
+    eps_t = np.where(d_n <= 0, 0.1, eps_t)  # pure tension
+    phi = np.asarray(conc_columns.calc_phi(eps_t, fy))
+    return phi * n, phi * m
+
+
+def build_interaction_library(
+    rhos: tuple[float, ...] = RHOS,
+    gammas: tuple[float, ...] = GAMMAS,
+    fpcs: tuple[float, ...] = FPCS,
+    fys: tuple[float, ...] = FYS,
+    n_points: int = 40,
+) -> InteractionLibrary:
+    """
+    Returns an InteractionLibrary built by analyzing a square H_REF column
+    with N_BARS_PER_FACE_REF bars per face at every point of the grid.
+
+    Every grid dimension needs at least two values. This runs one
+    concreteproperties analysis per grid point, so build the library once
+    and save it with save_interaction_library().
+    """
+    gross_area = H_REF**2
+    n_bars = 4 * (N_BARS_PER_FACE_REF - 1)
+    m_n = np.zeros((len(rhos), len(gammas), len(fpcs), len(fys), len(P_LEVELS)))
+
+    for i_rho, rho in enumerate(rhos):
+        bar_area = rho * gross_area / n_bars
+        for i_gamma, gamma in enumerate(gammas):
+            edge_dist = (1 - gamma) * H_REF / 2
+            for i_fpc, fpc in enumerate(fpcs):
+                for i_fy, fy in enumerate(fys):
+                    conc_sec = create_column_section(
+                        H_REF,
+                        H_REF,
+                        fpc,
+                        fy,
+                        bar_area,
+                        N_BARS_PER_FACE_REF,
+                        N_BARS_PER_FACE_REF,
+                        edge_dist,
+                    )
+                    phi_pn, phi_mn = calc_factored_interaction(
+                        conc_sec, H_REF, edge_dist, fy, n_points=n_points
+                    )
+                    p_n = phi_pn / (fpc * gross_area)
+                    order = np.argsort(p_n)
+                    curve = np.interp(
+                        P_LEVELS,
+                        p_n[order],
+                        phi_mn[order] / (fpc * gross_area * H_REF),
+                        left=np.nan,
+                        right=np.nan,
+                    )
+                    m_n[i_rho, i_gamma, i_fpc, i_fy] = curve
+
+    return InteractionLibrary(
+        rhos=np.asarray(rhos, dtype=float),
+        gammas=np.asarray(gammas, dtype=float),
+        fpcs=np.asarray(fpcs, dtype=float),
+        fys=np.asarray(fys, dtype=float),
+        p_levels=P_LEVELS.copy(),
+        m_n=m_n,
+    )
+
+
+def save_interaction_library(
+    library: InteractionLibrary, filename: str = DEFAULT_LIBRARY_FILE
+) -> None:
+    """
+    Saves the library to a compressed .npz file with the curves as float32.
+    """
+    np.savez_compressed(
+        filename,
+        rhos=library.rhos,
+        gammas=library.gammas,
+        fpcs=library.fpcs,
+        fys=library.fys,
+        p_levels=library.p_levels,
+        m_n=library.m_n.astype(np.float32),
+    )
+
+
+def load_interaction_library(
+    filename: str = DEFAULT_LIBRARY_FILE,
+) -> InteractionLibrary:
+    """
+    Returns the InteractionLibrary saved by save_interaction_library().
+    """
+    with np.load(filename) as data:
+        return InteractionLibrary(
+            rhos=data["rhos"],
+            gammas=data["gammas"],
+            fpcs=data["fpcs"],
+            fys=data["fys"],
+            p_levels=data["p_levels"],
+            m_n=data["m_n"].astype(float),
+        )
+
+
+def parse_column_demands(column_data: dict[str, list[str]]) -> dict[str, np.ndarray]:
+    """
+    Returns arrays of the geometry, reinforcement and factored loads of every
+    column in the dictionary created from extract_RAM_conc_column_data().
+    Moments are the larger of the top and bottom absolute values in kip-in.
+    """
+    b, h = cs.parse_sizes(column_data["size"])
+    n_bars, bar_idx = cs.parse_rebar(column_data["rebar"])
+
+    def as_float(key: str) -> np.ndarray:
+        return np.asarray(column_data[key], dtype=float)
+
+    return {
+        "b": b,
+        "h": h,
+        "fpc": as_float("fpc"),
+        "n_bars": n_bars,
+        "bar_idx": bar_idx,
+        "pu": as_float("pu"),
+        "mux": 12 * np.maximum(abs(as_float("mu_x_top")), abs(as_float("mu_x_bot"))),
+        "muy": 12 * np.maximum(abs(as_float("mu_y_top")), abs(as_float("mu_y_bot"))),
+    }
+
+
+def screen_columns(
+    library: InteractionLibrary,
+    column_data: dict[str, list[str]],
+    fy: float = 60,
+    margin: float = 0.1,
+    cover: float = 1.5,
+) -> "pd.DataFrame":
+    """
+    Returns a DataFrame, indexed like the extracted column data, of the
+    screening utilization of every column and its status: 'pass' if the
+    utilization is at most 1 - margin, 'fail' if it is over 1 + margin and
+    'borderline' otherwise.
+
+    The moment capacities about each axis are interpolated from the
+    library and combined with the linear load contour
+    Mux / phiMnx + Muy / phiMny. The utilization is the larger of that and
+    Pu / phiPn,max. Columns outside the library grid, or whose axial load
+    is past the end of a curve the interpolation uses, are borderline with
+    a NaN utilization unless they fail Pu / phiPn,max.
+
+    Args:
+    library: normalized interaction curves
+    column_data: extracted RAM column design data
+    fy: yield stress of rebar in ksi
+    margin: half width of the utilization band sent on to full analysis
+    cover: clear cover to the ties in inches
+    """
+    import pandas as pd
+    from scipy.interpolate import RegularGridInterpolator
+
+    demands = parse_column_demands(column_data)
+    b, h, fpc = demands["b"], demands["h"], demands["fpc"]
+    bar_idx = demands["bar_idx"]
+    gross_area = b * h
+    bar_area = cs.BAR_AREA[bar_idx]
+    d_tie = cs.BAR_DIA[rebar_takeoff.TIE_BAR_IDX[bar_idx]]
+    edge_dist = cover + d_tie + cs.BAR_DIA[bar_idx] / 2
+
+    rho = demands["n_bars"] * bar_area / gross_area
+    fys = np.full(b.shape, fy, dtype=float)
+    p_n = demands["pu"] / (fpc * gross_area)
+
+    # interpolate the curves with 0 past their ends alongside a flag that is
+    # 1 past the end, any corner past its curve with a nonzero weight makes
+    # the interpolated capacity meaningless
+    beyond = np.isnan(library.m_n)
+    interpolator = RegularGridInterpolator(
+        (library.rhos, library.gammas, library.fpcs, library.fys, library.p_levels),
+        np.stack([np.where(beyond, 0.0, library.m_n), beyond], axis=-1),
+        bounds_error=False,
+        fill_value=np.nan,
+    )
+
+    def interp_m_n(gamma: np.ndarray) -> np.ndarray:
+        m_n, past_end = interpolator(np.column_stack([rho, gamma, fpc, fys, p_n])).T
+        return np.where(past_end > 0, np.nan, m_n)
+
+    m_nx = interp_m_n((h - 2 * edge_dist) / h)
+    m_ny = interp_m_n((b - 2 * edge_dist) / b)
+    phi_mnx = m_nx * fpc * gross_area * h
+    phi_mny = m_ny * fpc * gross_area * b
+
+    phi_pn_max = 0.65 * conc_columns.calc_Pn(b, h, fpc, demands["n_bars"], bar_area, fy)
+    axial_util = demands["pu"] / phi_pn_max
+    with np.errstate(divide="ignore", invalid="ignore"):
+        moment_util = demands["mux"] / phi_mnx + demands["muy"] / phi_mny
+    in_grid = np.isfinite(moment_util)
+    axial_fail = axial_util > 1 + margin
+    utilization = np.where(
+        in_grid | axial_fail, np.fmax(axial_util, moment_util), np.nan
+    )
+
+    status = np.full(b.shape, "borderline", dtype=object)
+    status[in_grid & (utilization <= 1 - margin)] = "pass"
+    status[in_grid & (utilization > 1 + margin)] = "fail"
+    status[axial_fail] = "fail"
+
+    return pd.DataFrame(
+        {"utilization": utilization, "status": status},
+        index=pd.MultiIndex.from_arrays(
+            [column_data["level"], column_data["grid_loc"]],
+            names=["story", "grid_loc"],
+        ),
+    )
+
+
+def check_column(
+    b: float,
+    h: float,
+    fpc: float,
+    n_bars: int,
+    bar_size: str,
+    pu: float,
+    mux: float,
+    muy: float,
+    fy: float = 60,
+    cover: float = 1.5,
+    n_points: int = 40,
+) -> float:
+    """
+    Returns the utilization of a column from a full concreteproperties
+    analysis about each axis, combined as in screen_columns().
+
+    Args:
+    b: width of column in inches
+    h: depth of column in inches
+    fpc: f'c in ksi
+    n_bars: number of vertical rebar
+    bar_size: size of the vertical rebar (e.g. '#8')
+    pu: factored axial load in kips
+    mux: factored moment about x in kip-in
+    muy: factored moment about y in kip-in
+    fy: yield stress of rebar in ksi
+    cover: clear cover to the ties in inches
+    n_points: number of points on the interaction diagrams
+    """
+    bar_idx = cs.BAR_SIZES.index(bar_size)
+    d_tie = cs.BAR_DIA[rebar_takeoff.TIE_BAR_IDX[bar_idx]]
+    edge_dist = cover + d_tie + cs.BAR_DIA[bar_idx] / 2
+    n_bars_b, n_bars_h = rebar_takeoff.calc_bars_per_face(b, h, n_bars)
+    # keep the total steel area if the bars do not split evenly on the faces
+    bar_area = n_bars * cs.BAR_AREA[bar_idx] / (2 * n_bars_b + 2 * n_bars_h - 4)
+
+    conc_sec = create_column_section(
+        b, h, fpc, fy, bar_area, n_bars_b, n_bars_h, edge_dist
+    )
+    phi_pn_max = 0.65 * conc_columns.calc_Pn(
+        b, h, fpc, n_bars, cs.BAR_AREA[bar_idx], fy
+    )
+
+    utilization = pu / phi_pn_max
+    if utilization > 1:
+        return utilization
+
+    moment_util = 0.0
+    for theta, depth, mu in [(0, h, mux), (np.pi / 2, b, muy)]:
+        phi_pn, phi_mn = calc_factored_interaction(
+            conc_sec, depth, edge_dist, fy, theta, n_points
+        )
+        order = np.argsort(phi_pn)
+        phi_mn_at_pu = np.interp(pu, phi_pn[order], phi_mn[order], left=0, right=0)
+        moment_util += mu / phi_mn_at_pu if phi_mn_at_pu > 0 else np.inf
+    return max(utilization, moment_util)
+
+
+def check_borderline_columns(
+    screen_df: "pd.DataFrame",
+    column_data: dict[str, list[str]],
+    fy: float = 60,
+    cover: float = 1.5,
+    progress: Callable[[int, int], None] | None = None,
+) -> "pd.DataFrame":
+    """
+    Returns a copy of the screen_columns() results with the borderline
+    columns checked by full section analysis, their utilization replaced
+    and their status set to 'pass' or 'fail'.
+
+    Args:
+    screen_df: results of screen_columns()
+    column_data: extracted RAM column design data
+    fy: yield stress of rebar in ksi
+    cover: clear cover to the ties in inches
+    progress: called with the number of columns checked and the number of
+        borderline columns after each check
+    """
+    demands = parse_column_demands(column_data)
+    checked_df = screen_df.copy()
+    borderline = np.flatnonzero(screen_df["status"].to_numpy() == "borderline")
+    for n_checked, idx in enumerate(borderline, start=1):
+        utilization = check_column(
+            demands["b"][idx],
+            demands["h"][idx],
+            demands["fpc"][idx],
+            demands["n_bars"][idx],
+            cs.BAR_SIZES[demands["bar_idx"][idx]],
+            demands["pu"][idx],
+            demands["mux"][idx],
+            demands["muy"][idx],
+            fy,
+            cover,
+        )
+        checked_df.iloc[idx, 0] = utilization
+        checked_df.iloc[idx, 1] = "pass" if utilization <= 1 else "fail"
+        if progress is not None:
+            progress(n_checked, len(borderline))
+    return checked_df
+
+
+if __name__ == "__main__":
+    save_interaction_library(build_interaction_library())
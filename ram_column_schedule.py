@@ -1,4 +1,17 @@
-import pandas as pd
+from typing import TYPE_CHECKING
+
+# pandas is only needed to build the schedule, so it is imported there to
+# keep parse-only scripts fast to start.
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def split_RAM_csv_lines(lines: list[str]) -> list[list[str]]:
+    """
+    Returns the rows of a RAM Concrete Column "Column Design" csv split into
+    their comma separated fields, ready for extract_RAM_conc_column_data().
+    """
+    return [line.rstrip("\r\n").split(",") for line in lines]
 
 
 def extract_RAM_conc_column_data(
@@ -95,13 +108,15 @@ def create_full_RAM_concrete_column_schedule(
     column_data: dict[str, list[str]],
     xlsx: bool = False,
     output_filename: str = "RAM_Concrete_Column_Schedule.xlsx",
-) -> pd.DataFrame:
+) -> "pd.DataFrame":
     """
     Returns a column schedule from the dictionary created from the
     extract_RAM_conc_column_data() function for the streamlit app.
 
     If xlsx = True, it will also produce an Excel file.
     """
+    import pandas as pd
+
     levels_and_loc_dict = {
         k: column_data[k] for k in ("level", "grid_loc") if k in column_data
     }
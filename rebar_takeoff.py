@@ -0,0 +1,199 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+import column_stacks as cs
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+LBS_PER_TON = 2000.0
+
+# Ties are #3 for longitudinal bars up to #10 and #4 for #11 and larger,
+# per ACI 318-14 25.7.2.2
+TIE_BAR_IDX = np.where(
+    cs.BAR_DIA <= cs.BAR_DIA[cs.BAR_SIZES.index("#10")],
+    cs.BAR_SIZES.index("#3"),
+    cs.BAR_SIZES.index("#4"),
+)
+
+
+@dataclass
+class RebarTakeoff:
+    """
+    Vertical bar and tie weights in lbs of every column of a building.
+
+    The weight arrays have the shape (len(grid_locs), len(stories)) with the
+    stories ordered from the bottom of the building to the top and are 0
+    where a grid location has no column on a story.
+    """
+
+    grid_locs: np.ndarray
+    stories: np.ndarray
+    exists: np.ndarray
+    vert_bar_weight: np.ndarray
+    tie_weight: np.ndarray
+
+    @property
+    def total_weight(self) -> np.ndarray:
+        return self.vert_bar_weight + self.tie_weight
+
+
+def calc_bars_per_face(
+    b: np.ndarray, h: np.ndarray, n_bars: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the estimated number of bars, including the corner bars, on the
+    faces parallel to b and to h of rectangular columns, assuming the bars
+    are spread evenly around the perimeter.
+    """
+    n_bars_b = np.rint(n_bars * b / (2 * (b + h))).astype(int) + 1
+    n_bars_b = np.clip(n_bars_b, 2, np.maximum(n_bars // 2, 2))
+    n_bars_h = np.maximum((n_bars - 2 * n_bars_b) // 2 + 2, 2)
+    return n_bars_b, n_bars_h
+
+
+def calc_tie_weights(stacks: cs.ColumnStacks, cover: float = 1.5) -> np.ndarray:
+    """
+    Returns the weight in lbs of the ties of every column.
+
+    Tie spacing is the least of 16 longitudinal bar diameters, 48 tie
+    diameters and the least column dimension per ACI 318-14 25.7.2.1. Each
+    tie set is a perimeter hoop plus a crosstie for every other
+    intermediate bar on each face, and every piece has two hooks extending
+    6 tie diameters but not less than 3 in.
+
+    Args:
+    stacks: column stacks to take off
+    cover: clear cover to the ties in inches
+    """
+    bar_idx = np.where(stacks.exists, stacks.bar_idx, 0)
+    tie_idx = TIE_BAR_IDX[bar_idx]
+    d_bar = cs.BAR_DIA[bar_idx]
+    d_tie = cs.BAR_DIA[tie_idx]
+    b = np.where(stacks.exists, stacks.b, 0.0)
+    h = np.where(stacks.exists, stacks.h, 0.0)
+    length = np.where(stacks.exists, stacks.length, 0.0) * 12  # in
+
+    spacing = np.minimum(np.minimum(16 * d_bar, 48 * d_tie), np.minimum(b, h))
+    spacing = np.where(stacks.exists, spacing, 1.0)
+    n_sets = np.where(stacks.exists, np.ceil(length / spacing) + 1, 0)
+
+    hook = 2 * np.maximum(6 * d_tie, 3.0)
+    core_b = b - 2 * cover - d_tie
+    core_h = h - 2 * cover - d_tie
+    hoop = 2 * (core_b + core_h) + hook
+
+    n_bars_b, n_bars_h = calc_bars_per_face(
+        np.where(stacks.exists, b, 1.0), np.where(stacks.exists, h, 1.0), stacks.n_bars
+    )
+    n_crossties_b = (n_bars_b - 1) // 2  # crossties parallel to h
+    n_crossties_h = (n_bars_h - 1) // 2  # crossties parallel to b
+    crossties = n_crossties_b * (core_h + hook) + n_crossties_h * (core_b + hook)
+
+    tie_length = (hoop + crossties) / 12  # ft
+    return n_sets * tie_length * cs.BAR_PLF[tie_idx]
+
+
+def calc_rebar_takeoff(
+    column_data: dict[str, list[str]],
+    story_heights: dict[str, float] | None = None,
+    splice_every: int = 2,
+    fy: float = 60,
+    cover: float = 1.5,
+) -> RebarTakeoff:
+    """
+    Returns the RebarTakeoff for the dictionary created from the
+    extract_RAM_conc_column_data() function.
+
+    Args:
+    column_data: extracted RAM column design data
+    story_heights: floor to floor height in ft of each story. The RAM
+        unbraced lengths are used if not given.
+    splice_every: number of stories between vertical bar splices
+    fy: yield stress of rebar in ksi
+    cover: clear cover to the ties in inches
+    """
+    stacks = cs.build_column_stacks(column_data, story_heights=story_heights)
+    splices = cs.calc_splice_points(stacks, splice_every)
+
+    return RebarTakeoff(
+        grid_locs=stacks.grid_locs,
+        stories=stacks.stories,
+        exists=stacks.exists,
+        vert_bar_weight=cs.calc_vert_bar_weights(stacks, splices, fy),
+        tie_weight=calc_tie_weights(stacks, cover),
+    )
+
+
+def takeoff_by_column(takeoff: RebarTakeoff) -> "pd.DataFrame":
+    """
+    Returns a DataFrame of the vertical bar, tie and total weights in lbs of
+    every column, indexed by story and grid location.
+    """
+    import pandas as pd
+
+    story_idx, grid_idx = np.nonzero(takeoff.exists.T)
+    index = pd.MultiIndex.from_arrays(
+        [takeoff.stories[story_idx], takeoff.grid_locs[grid_idx]],
+        names=["story", "grid_loc"],
+    )
+    vert = takeoff.vert_bar_weight.T[story_idx, grid_idx]
+    ties = takeoff.tie_weight.T[story_idx, grid_idx]
+    return pd.DataFrame(
+        {"vert_bar_weight": vert, "tie_weight": ties, "total_weight": vert + ties},
+        index=index,
+    )
+
+
+def takeoff_by_story(takeoff: RebarTakeoff) -> "pd.DataFrame":
+    """
+    Returns a DataFrame of the vertical bar, tie and total weights in lbs of
+    every story, from the bottom of the building to the top.
+    """
+    import pandas as pd
+
+    vert = takeoff.vert_bar_weight.sum(axis=0)
+    ties = takeoff.tie_weight.sum(axis=0)
+    return pd.DataFrame(
+        {
+            "columns": takeoff.exists.sum(axis=0),
+            "vert_bar_weight": vert,
+            "tie_weight": ties,
+            "total_weight": vert + ties,
+        },
+        index=pd.Index(takeoff.stories, name="story"),
+    )
+
+
+def calc_building_tonnage(takeoff: RebarTakeoff) -> dict[str, float]:
+    """
+    Returns the vertical bar, tie and total tonnage (US tons) of the building.
+    """
+    vert = takeoff.vert_bar_weight.sum() / LBS_PER_TON
+    ties = takeoff.tie_weight.sum() / LBS_PER_TON
+    return {"vert_bars": vert, "ties": ties, "total": vert + ties}
+
+
+def diff_takeoffs(old: RebarTakeoff, new: RebarTakeoff) -> "pd.DataFrame":
+    """
+    Returns a DataFrame comparing the tonnage (US tons) of each story between
+    two versions of a schedule. Stories that are only in one version have a
+    tonnage of 0 in the other.
+    """
+    import pandas as pd
+
+    old_tons = takeoff_by_story(old)["total_weight"] / LBS_PER_TON
+    new_tons = takeoff_by_story(new)["total_weight"] / LBS_PER_TON
+    stories = list(new_tons.index) + [s for s in old_tons.index if s not in new_tons]
+    diff_df = pd.DataFrame(
+        {
+            "old_tons": old_tons.reindex(stories, fill_value=0.0),
+            "new_tons": new_tons.reindex(stories, fill_value=0.0),
+        }
+    )
+    diff_df["change_tons"] = diff_df["new_tons"] - diff_df["old_tons"]
+    diff_df.loc["Total"] = diff_df.sum()
+    return diff_df
@@ -1,8 +1,5 @@
 import streamlit as st
 from io import StringIO
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
 
 
 import ram_column_schedule as rcs
@@ -10,13 +7,8 @@ import conc_columns
 import aci_318_14_materials
 import rebar
 
-# Import geometry functions for creating rectangular sections
-from sectionproperties.pre.library.primitive_sections import rectangular_section
-from concreteproperties.pre import add_bar_rectangular_array
-
-
-## Import analysis section
-from concreteproperties.concrete_section import ConcreteSection
+# The plotting and section analysis libraries are slow to import, so they are
+# only imported once a column is selected for inspection below.
 
 st.write("# RAM Column Schedule")
 
@@ -33,17 +25,104 @@ if concrete_design_csv is not None:
     stringio = StringIO(concrete_design_csv.getvalue().decode("utf-8"))
     string_data = stringio.readlines()
 
-    parsed_data = []
-    for sd in string_data:
-        split_data = sd.split(",")
-        parsed_data.append(split_data)
-
+    parsed_data = rcs.split_RAM_csv_lines(string_data)
     column_data = rcs.extract_RAM_conc_column_data(parsed_data)
     sched_df = rcs.create_full_RAM_concrete_column_schedule(column_data)
     # display the schedule DataFrame
     st.dataframe(sched_df)
     st.divider()
 
+    st.write("# Rebar Takeoff")
+
+    import pandas as pd
+    import rebar_takeoff
+
+    # Story heights default to the RAM unbraced lengths and can be edited
+    default_heights = {}
+    for level, lux in zip(column_data["level"], column_data["lux"]):
+        default_heights.setdefault(level, float(lux))
+    heights_df = st.data_editor(
+        pd.DataFrame(
+            {
+                "story": list(default_heights),
+                "height (ft)": list(default_heights.values()),
+            }
+        ),
+        hide_index=True,
+        disabled=["story"],
+    )
+    story_heights = dict(zip(heights_df["story"], heights_df["height (ft)"]))
+
+    takeoff = rebar_takeoff.calc_rebar_takeoff(column_data, story_heights)
+    tonnage = rebar_takeoff.calc_building_tonnage(takeoff)
+    st.dataframe(rebar_takeoff.takeoff_by_story(takeoff))
+    st.markdown(
+        f"Vertical bars: {round(tonnage['vert_bars'], 2)} tons, "
+        f"ties: {round(tonnage['ties'], 2)} tons, "
+        f"total: {round(tonnage['total'], 2)} tons."
+    )
+
+    previous_csv = st.file_uploader(
+        "Upload a previous Concrete Design Output to compare tonnage (*.csv)",
+        "csv",
+        accept_multiple_files=False,
+    )
+    if previous_csv is not None:
+        previous_stringio = StringIO(previous_csv.getvalue().decode("utf-8"))
+        previous_data = rcs.extract_RAM_conc_column_data(
+            rcs.split_RAM_csv_lines(previous_stringio.readlines())
+        )
+        previous_heights = {}
+        for level, lux in zip(previous_data["level"], previous_data["lux"]):
+            previous_heights.setdefault(level, story_heights.get(level, float(lux)))
+        previous_takeoff = rebar_takeoff.calc_rebar_takeoff(
+            previous_data, previous_heights
+        )
+        st.dataframe(rebar_takeoff.diff_takeoffs(previous_takeoff, takeoff))
+
+    st.divider()
+
+    st.write("# Interaction Screening")
+
+    import interaction_library
+
+    # Every column is screened against the precomputed interaction library,
+    # only the borderline columns need a full section analysis
+    library = interaction_library.load_interaction_library()
+    screen_df = interaction_library.screen_columns(library, column_data)
+    st.markdown(
+        ", ".join(
+            f"{count} {status}"
+            for status, count in screen_df["status"].value_counts().items()
+        )
+    )
+
+    # The full analysis takes about a second per column, so the results are
+    # cached on the uploaded file and kept while the box stays checked
+    @st.cache_data(show_spinner=False)
+    def check_borderline_columns(csv_bytes: bytes, _screen_df, _column_data):
+        progress_bar = st.progress(0.0)
+
+        def show_progress(n_checked: int, n_borderline: int) -> None:
+            progress_bar.progress(
+                n_checked / n_borderline,
+                text=f"Checked {n_checked} of {n_borderline} borderline columns",
+            )
+
+        checked_df = interaction_library.check_borderline_columns(
+            _screen_df, _column_data, progress=show_progress
+        )
+        progress_bar.empty()
+        return checked_df
+
+    if st.checkbox("Check borderline columns with full section analysis"):
+        screen_df = check_borderline_columns(
+            concrete_design_csv.getvalue(), screen_df, column_data
+        )
+    st.dataframe(screen_df)
+
+    st.divider()
+
     st.write("# Design Inspection")
 
     # Select level for inspection
@@ -69,8 +148,22 @@ if concrete_design_csv is not None:
         placeholder="Select grid location",
     )
 
+    # Only the schedule is needed until a column is picked for inspection
+    if user_level is None or user_grid_loc is None:
+        st.stop()
+
     design_column, geometry_column = st.columns(2)
 
+    import numpy as np
+    import matplotlib.pyplot as plt
+
+    # Import geometry functions for creating rectangular sections
+    from sectionproperties.pre.library.primitive_sections import rectangular_section
+    from concreteproperties.pre import add_bar_rectangular_array
+
+    ## Import analysis section
+    from concreteproperties.concrete_section import ConcreteSection
+
     with design_column:
         # Extract design values
         IDX = pd.IndexSlice
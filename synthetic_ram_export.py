@@ -0,0 +1,202 @@
+import random
+import string
+
+import conc_columns
+import rebar
+
+# Candidate square/rectangular column sizes (b x h, inches), smallest first
+COLUMN_SIZES = [
+    (12, 12),
+    (14, 14),
+    (14, 24),
+    (16, 16),
+    (18, 18),
+    (18, 24),
+    (20, 20),
+    (22, 22),
+    (24, 24),
+    (24, 30),
+    (28, 28),
+    (30, 30),
+    (32, 32),
+    (36, 36),
+]
+
+# Vertical bar sizes in order of preference for increasing steel demand
+VERT_BAR_SIZES = ["#6", "#7", "#8", "#9", "#10", "#11"]
+
+FPC_VALUES = [5, 6, 8, 10]  # ksi
+
+# Load combinations with their factors on dead, live, wind and seismic loads
+LOAD_COMBOS = [
+    ("1.4D", (1.4, 0.0, 0.0, 0.0)),
+    ("1.2D+1.6L+0.5Lr", (1.2, 1.6, 0.0, 0.0)),
+    ("1.2D+1.6Lr+L", (1.2, 1.0, 0.0, 0.0)),
+    ("1.2D+1.0W+L+0.5Lr", (1.2, 1.0, 1.0, 0.0)),
+    ("0.9D+1.0W", (0.9, 0.0, 1.0, 0.0)),
+    ("1.2D+1.0E+L", (1.2, 1.0, 0.0, 1.0)),
+    ("0.9D+1.0E", (0.9, 0.0, 0.0, 1.0)),
+]
+
+# Factored moment per unit of f'c * Ag * h used to size the moments, about
+# the pure bending capacity of a column with 1 to 2% steel
+MOMENT_SCALE = 0.2
+
+
+def grid_label(idx: int) -> str:
+    """
+    Returns a lettered grid line label for a zero based index
+    (0 -> 'A', 25 -> 'Z', 26 -> 'AA', ...).
+    """
+    label = ""
+    idx += 1
+    while idx > 0:
+        idx, rem = divmod(idx - 1, 26)
+        label = string.ascii_uppercase[rem] + label
+    return label
+
+
+def pick_rebar(b: float, h: float, rho_target: float) -> str:
+    """
+    Returns a longitudinal rebar callout (e.g. '12-#8') that gives a
+    reinforcement ratio close to rho_target using an even bar count.
+    """
+    gross_area = b * h
+    for bar_size in VERT_BAR_SIZES:
+        bar_area = rebar.REBAR[bar_size]["As"]
+        num_bars = max(4, 2 * round(rho_target * gross_area / bar_area / 2))
+        if num_bars <= 20:
+            return f"{num_bars}-{bar_size}"
+    return f"{num_bars}-{VERT_BAR_SIZES[-1]}"
+
+
+def generate_RAM_column_design_csv(
+    n_stories: int = 10,
+    n_grid_x: int = 4,
+    n_grid_y: int = 4,
+    n_sizes: int = 4,
+    n_load_combos: int = 3,
+    story_height: float = 12.0,
+    seed: int = 0,
+) -> str:
+    """
+    Returns the text of a synthetic RAM Concrete Column "Column Design" csv
+    that can be read by ram_column_schedule.
+
+    The building has n_stories levels with one column at every intersection
+    of n_grid_x lettered and n_grid_y numbered grid lines. Column sizes step
+    down the height of the building through n_sizes sections and f'c drops
+    with the size.
+
+    Each column gets random dead, live, wind and seismic loads in proportion
+    to each other, factored by the first n_load_combos entries of
+    LOAD_COMBOS. The combination with the largest axial load and moments
+    relative to the column capacity governs and is scaled to a utilization
+    drawn for the column, so most columns pass with some near or over
+    capacity whatever their size, f'c and rebar.
+
+    Args:
+    n_stories: number of levels
+    n_grid_x: number of lettered grid lines
+    n_grid_y: number of numbered grid lines
+    n_sizes: number of distinct column sizes used over the building height
+    n_load_combos: number of load combinations that can govern
+    story_height: unbraced length of each column in feet
+    seed: seed for the random number generator
+    """
+    rng = random.Random(seed)
+    n_sizes = max(1, min(n_sizes, len(COLUMN_SIZES), n_stories))
+    n_load_combos = max(1, min(n_load_combos, len(LOAD_COMBOS)))
+    combos = LOAD_COMBOS[:n_load_combos]
+
+    # Sections used from the roof down, the largest sections at the base
+    step = max(1, len(COLUMN_SIZES) // n_sizes)
+    sizes = COLUMN_SIZES[: step * n_sizes : step]
+    stories_per_size = -(-n_stories // n_sizes)
+    grid_locs = [
+        f"{grid_label(i)}-{j + 1}" for i in range(n_grid_x) for j in range(n_grid_y)
+    ]
+    rho_by_grid = {gl: rng.uniform(0.01, 0.03) for gl in grid_locs}
+
+    lines = []
+    for story_idx in range(n_stories):
+        level = f"Level {n_stories - story_idx + 1}"
+        n_above = story_idx + 1
+        size_idx = min(n_sizes - 1, story_idx // stories_per_size)
+        b, h = sizes[size_idx]
+        fpc = FPC_VALUES[size_idx * len(FPC_VALUES) // n_sizes]
+
+        for grid_loc in grid_locs:
+            longitudinal = pick_rebar(b, h, rho_by_grid[grid_loc])
+            n_bars, bar_size = longitudinal.split("-")
+            phi_pn_max = 0.65 * conc_columns.calc_Pn(
+                b, h, fpc, int(n_bars), rebar.REBAR[bar_size]["As"]
+            )
+            m_ref_x = MOMENT_SCALE * fpc * b * h * h / 12  # kip-ft
+            m_ref_y = MOMENT_SCALE * fpc * b * h * b / 12
+
+            # Dead, live, wind and seismic (axial, Mx, My) loads in proportion
+            # to each other, the lateral moments grow down the building
+            dead = 1.0
+            live = rng.uniform(0.3, 0.8) * dead
+            ecc_x, ecc_y = rng.uniform(0.05, 0.2), rng.uniform(0.05, 0.2)
+            # pattern live loading gives larger moments
+            ecc_lx, ecc_ly = rng.uniform(0.1, 0.5), rng.uniform(0.1, 0.5)
+            lateral = n_above / n_stories * rng.uniform(0.1, 0.8)
+            wind = (
+                0.0,
+                lateral * rng.uniform(0.2, 1.0),
+                lateral * rng.uniform(0.2, 1.0),
+            )
+            seismic = (
+                0.0,
+                lateral * rng.uniform(0.2, 1.0),
+                lateral * rng.uniform(0.2, 1.0),
+            )
+            service = [
+                (dead, ecc_x * dead, ecc_y * dead),
+                (live, ecc_lx * live, ecc_ly * live),
+                wind,
+                seismic,
+            ]
+
+            # Factored loads of each combination as fractions of the column
+            # capacity, the largest governs
+            demands = []
+            for combo, factors in combos:
+                p, mx, my = (
+                    sum(f * load[i] for f, load in zip(factors, service))
+                    for i in range(3)
+                )
+                demands.append((p + mx + my, combo, p, mx, my))
+            demand, combo, p, mx, my = max(demands)
+
+            # Scale the governing combination to a utilization drawn for the
+            # column
+            scale = rng.triangular(0.35, 1.3, 0.8) / demand
+            pu = round(scale * p * phi_pn_max, 1)
+            mu_x_top = round(scale * mx * m_ref_x * rng.choice([-1, 1]), 1)
+            mu_x_bot = round(-mu_x_top * rng.uniform(-1.0, 1.0), 1)
+            mu_y_top = round(scale * my * m_ref_y * rng.choice([-1, 1]), 1)
+            mu_y_bot = round(-mu_y_top * rng.uniform(-1.0, 1.0), 1)
+
+            lines.extend(
+                [
+                    f"Level.,{level}",
+                    f"Grid Location:.,,{grid_loc}",
+                    f"Size:.,{b}x{h}   ,",
+                    f"Longitudinal:.,{longitudinal} ,",
+                    f"f'c (ksi):.,   {fpc}",
+                    f"Unbraced Length (ft).,{story_height},{story_height}",
+                    "K.,1.0,1.0",
+                    f"Load Combination:.,{combo}",
+                    f"Axial,Pu (kips),,{pu}",
+                    f"Moment,Top,Mux (kip-ft),{mu_x_top}",
+                    f",,Muy (kip-ft),{mu_y_top}",
+                    f"Moment,Bottom,Mux (kip-ft),{mu_x_bot}",
+                    f",,Muy (kip-ft),{mu_y_bot}",
+                    "",
+                ]
+            )
+
+    return "\n".join(lines)
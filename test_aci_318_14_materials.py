@@ -1,6 +1,12 @@
 import math
+import subprocess
+import sys
+from pathlib import Path
+
 import aci_318_14_materials as aci
 
+REPO_DIR = Path(__file__).resolve().parent
+
 
 def test_calculate_beta_1():
     assert aci.calculate_beta_1(4) == 0.85
@@ -11,3 +17,12 @@ def test_calculate_beta_1():
 def test_calc_modulus_of_rupture():
     assert math.isclose(aci.calc_modulus_of_rupture(4), 0.474341649)
     assert math.isclose(aci.calc_modulus_of_rupture(10), 0.75)
+
+
+def test_import_does_not_import_concreteproperties():
+    code = (
+        "import sys\n"
+        "import aci_318_14_materials\n"
+        "assert 'concreteproperties' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=REPO_DIR, check=True)
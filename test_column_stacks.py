@@ -0,0 +1,81 @@
+import math
+
+import numpy as np
+
+import column_stacks as cs
+
+# Two stacks listed top down as in the RAM csv, B-1 has no column on Level 4
+TEST_COLUMN_DATA = {
+    "level": ["Level 4", "Level 3", "Level 3", "Level 2", "Level 2"],
+    "grid_loc": ["A-1", "A-1", "B-1", "A-1", "B-1"],
+    "size": ["14x14", "14x14", "18x18", "18x24", "18x18"],
+    "rebar": ["4-#8", "8-#8", "8-#6", "8-#8", "8-#6"],
+    "fpc": ["5", "5", "6", "8", "6"],
+    "lux": ["10", "10", "10", "12", "12"],
+}
+
+
+def test_build_column_stacks():
+    stacks = cs.build_column_stacks(TEST_COLUMN_DATA)
+    assert list(stacks.stories) == ["Level 2", "Level 3", "Level 4"]
+    assert list(stacks.grid_locs) == ["A-1", "B-1"]
+    assert stacks.column_idx.tolist() == [[3, 1, 0], [4, 2, -1]]
+    assert stacks.b.tolist()[0] == [18, 14, 14]
+    assert stacks.h.tolist()[0] == [24, 14, 14]
+    assert stacks.n_bars.tolist() == [[8, 8, 4], [8, 8, 0]]
+    assert cs.BAR_SIZES[stacks.bar_idx[1, 0]] == "#6"
+    assert stacks.bar_idx[1, 2] == -1
+    assert np.isnan(stacks.fpc[1, 2])
+
+
+def test_calc_transitions():
+    transitions = cs.calc_transitions(cs.build_column_stacks(TEST_COLUMN_DATA))
+    assert transitions["size"].tolist() == [[False, True, False], [False] * 3]
+    assert transitions["rebar"].tolist() == [[False, False, True], [False] * 3]
+    assert transitions["fpc"].tolist() == [[False, True, False], [False] * 3]
+
+
+def test_calc_compression_lap_length():
+    assert math.isclose(cs.calc_compression_lap_length(1.0), 30)
+    assert math.isclose(cs.calc_compression_lap_length(1.0, fy=80), 48)
+    assert math.isclose(cs.calc_compression_lap_length(0.375), 12)
+
+
+def test_calc_splice_points():
+    stacks = cs.build_column_stacks(TEST_COLUMN_DATA)
+    assert cs.calc_splice_points(stacks).tolist() == [
+        [False, True, True],
+        [False, False, False],
+    ]
+    assert cs.calc_splice_points(stacks, splice_every=1).tolist() == [
+        [False, True, True],
+        [False, True, False],
+    ]
+
+
+def test_calc_vert_bar_weights():
+    stacks = cs.build_column_stacks(TEST_COLUMN_DATA)
+    weights = cs.calc_vert_bar_weights(stacks)
+    assert math.isclose(weights[0, 0], 8 * 2.67 * 12)
+    assert math.isclose(weights[0, 1], 8 * 2.67 * (10 + 30 / 12))
+    assert math.isclose(weights[1, 1], 8 * 1.502 * 10)
+    assert weights[1, 2] == 0
+
+
+def test_summarize_column_stacks():
+    summary = cs.summarize_column_stacks(cs.build_column_stacks(TEST_COLUMN_DATA))
+    assert summary.loc["A-1", "stories"] == 3
+    assert summary.loc["B-1", "stories"] == 2
+    assert summary.loc["A-1", "splices"] == 2
+    assert summary.loc["A-1", "size_changes"] == 1
+    assert math.isclose(
+        summary.loc["B-1", "vert_bar_weight"], 8 * 1.502 * 12 + 8 * 1.502 * 10
+    )
+
+
+def test_build_column_stacks_with_story_heights():
+    story_heights = {"Level 2": 15, "Level 3": 11, "Level 4": 11}
+    stacks = cs.build_column_stacks(TEST_COLUMN_DATA, story_heights=story_heights)
+    assert stacks.length[0].tolist() == [15, 11, 11]
+    assert stacks.length[1, 0] == 15
+    assert np.isnan(stacks.length[1, 2])
@@ -0,0 +1,117 @@
+import dataclasses
+import math
+
+import numpy as np
+
+import interaction_library as il
+
+TEST_COLUMN_DATA = {
+    "level": ["Level 3", "Level 3", "Level 2"],
+    "grid_loc": ["A-1", "B-1", "A-1"],
+    "size": ["16x16", "12x12", "24x30"],
+    "rebar": ["16-#6", "4-#6", "20-#8"],
+    "fpc": ["6", "5", "10"],
+    "pu": ["552.9", "686.2", "1658.9"],
+    "mu_x_top": ["20", "5", "-150"],
+    "mu_x_bot": ["-40", "5", "100"],
+    "mu_y_top": ["10", "5", "80"],
+    "mu_y_bot": ["-15", "5", "-60"],
+}
+
+
+def test_calc_factored_interaction():
+    conc_sec = il.create_column_section(16, 16, 5, 60, 0.44, 3, 3, 2.5)
+    phi_pn, phi_mn = il.calc_factored_interaction(conc_sec, 16, 2.5, 60, n_points=20)
+    gross_area = 16 * 16
+    rebar_area = 8 * 0.44
+    p_0 = 0.85 * 5 * (gross_area - rebar_area) + 60 * rebar_area
+    assert math.isclose(phi_pn.max(), 0.65 * p_0, rel_tol=1e-3)
+    assert math.isclose(phi_pn.min(), -0.9 * 60 * rebar_area, rel_tol=1e-3)
+    assert phi_mn.min() >= 0
+
+
+def test_clear_split_lines():
+    # 0.65 * d_n puts the stress block edge 1.5e-7 in from the vertices of
+    # the centre bar hole about y, which crashed the mesher
+    conc_sec = il.create_column_section(20, 20, 8, 60, 0.44, 5, 6, 2.25)
+    d_n = il.clear_split_lines(conc_sec, [np.inf, 20 * 30 / 39, 5.0], np.pi / 2)
+    assert d_n[0] == np.inf
+    assert d_n[1] > 20 * 30 / 39
+    assert abs(0.65 * d_n[1] - 10) >= 1e-3
+    assert d_n[2] == 5.0
+
+
+def test_check_column_does_not_crash_mesher():
+    utilization = il.check_column(20, 20, 8, 18, "#6", 863.07, 442.44, 637.56)
+    assert 0 < utilization < 1
+
+
+def test_build_interaction_library(tmp_path):
+    library = il.build_interaction_library(
+        (0.01, 0.02), (0.7, 0.8), (5.0, 8.0), (60.0, 80.0), n_points=20
+    )
+    assert library.m_n.shape == (2, 2, 2, 2, len(il.P_LEVELS))
+    # more steel and a larger gamma give more moment capacity
+    assert np.all(
+        np.nanmax(library.m_n[1], axis=-1) > np.nanmax(library.m_n[0], axis=-1)
+    )
+    assert np.all(
+        np.nanmax(library.m_n[:, 1], axis=-1) > np.nanmax(library.m_n[:, 0], axis=-1)
+    )
+
+    filename = tmp_path / "library.npz"
+    il.save_interaction_library(library, filename)
+    loaded = il.load_interaction_library(filename)
+    assert np.allclose(loaded.m_n, library.m_n, atol=1e-6, equal_nan=True)
+    assert np.array_equal(loaded.fpcs, library.fpcs)
+
+
+def test_screen_columns():
+    library = il.load_interaction_library()
+    screen_df = il.screen_columns(library, TEST_COLUMN_DATA)
+    assert list(screen_df.index) == [
+        ("Level 3", "A-1"),
+        ("Level 3", "B-1"),
+        ("Level 2", "A-1"),
+    ]
+    assert list(screen_df["status"]) == ["pass", "fail", "pass"]
+
+    demands = il.parse_column_demands(TEST_COLUMN_DATA)
+    utilization = il.check_column(
+        demands["b"][0],
+        demands["h"][0],
+        demands["fpc"][0],
+        demands["n_bars"][0],
+        "#6",
+        demands["pu"][0],
+        demands["mux"][0],
+        demands["muy"][0],
+    )
+    assert math.isclose(screen_df["utilization"].iloc[0], utilization, rel_tol=0.05)
+
+
+def test_screen_columns_past_curve_end():
+    library = il.load_interaction_library()
+    library = dataclasses.replace(library, m_n=library.m_n.copy())
+    library.m_n[..., library.p_levels > 0.5] = np.nan
+    column_data = {key: values[:2] for key, values in TEST_COLUMN_DATA.items()}
+    column_data["pu"] = ["844.8", "686.2"]  # phi*Pn / (f'c * Ag) of 0.55, 0.95
+    screen_df = il.screen_columns(library, column_data)
+    assert list(screen_df["status"]) == ["borderline", "fail"]
+    assert np.isnan(screen_df["utilization"].iloc[0])
+    # failing Pu / phiPn,max is still reported
+    phi_pn_max = 0.65 * il.conc_columns.calc_Pn(12, 12, 5, 4, 0.44, 60)
+    assert math.isclose(screen_df["utilization"].iloc[1], 686.2 / phi_pn_max)
+
+
+def test_check_borderline_columns():
+    library = il.load_interaction_library()
+    screen_df = il.screen_columns(library, TEST_COLUMN_DATA)
+    screen_df.iloc[0, 1] = "borderline"
+    progress = []
+    checked_df = il.check_borderline_columns(
+        screen_df, TEST_COLUMN_DATA, progress=lambda *args: progress.append(args)
+    )
+    assert list(checked_df["status"]) == ["pass", "fail", "pass"]
+    assert screen_df["status"].iloc[0] == "borderline"
+    assert progress == [(1, 1)]
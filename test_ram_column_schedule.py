@@ -1,5 +1,11 @@
+import subprocess
+import sys
+from pathlib import Path
+
 import ram_column_schedule as rcs
 
+REPO_DIR = Path(__file__).resolve().parent
+
 TEST_RAW_DATA = [
     ["Level.", "1st Floor"],
     ["Grid Location:.", "A-1"],
@@ -41,3 +47,22 @@ def test_create_full_RAM_concrete_column_schedule():
     assert test_schedule.loc[:, "A-1"].iloc[5] == "-200"
     assert test_schedule.loc[:, "A-1"].iloc[6] == "-200"
     assert test_schedule.loc[:, "A-1"].iloc[7] == "-300"
+
+
+def test_split_RAM_csv_lines():
+    lines = ["Level.,1st Floor\n", "Grid Location:.,,A-1\r\n", "K.,1.0,1.0"]
+    assert rcs.split_RAM_csv_lines(lines) == [
+        ["Level.", "1st Floor"],
+        ["Grid Location:.", "", "A-1"],
+        ["K.", "1.0", "1.0"],
+    ]
+
+
+def test_parsing_does_not_import_pandas():
+    code = (
+        "import sys\n"
+        "import ram_column_schedule as rcs\n"
+        "rcs.extract_RAM_conc_column_data(rcs.split_RAM_csv_lines([]))\n"
+        "assert 'pandas' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=REPO_DIR, check=True)
@@ -0,0 +1,68 @@
+import math
+
+import numpy as np
+
+import column_stacks as cs
+import rebar_takeoff as rt
+
+TEST_COLUMN_DATA = {
+    "level": ["Level 3", "Level 3", "Level 2", "Level 2"],
+    "grid_loc": ["A-1", "B-1", "A-1", "B-1"],
+    "size": ["14x14", "14x24", "14x14", "14x24"],
+    "rebar": ["8-#8", "12-#11", "8-#8", "12-#11"],
+    "fpc": ["5", "5", "6", "6"],
+    "lux": ["10", "10", "10", "10"],
+}
+STORY_HEIGHTS = {"Level 2": 10, "Level 3": 12}
+
+
+def test_calc_bars_per_face():
+    n_bars_b, n_bars_h = rt.calc_bars_per_face(
+        np.array([14, 14, 20]), np.array([14, 24, 20]), np.array([8, 12, 4])
+    )
+    assert n_bars_b.tolist() == [3, 3, 2]
+    assert n_bars_h.tolist() == [3, 5, 2]
+
+
+def test_calc_tie_weights():
+    stacks = cs.build_column_stacks(TEST_COLUMN_DATA)
+    tie_weights = rt.calc_tie_weights(stacks)
+    # 10 sets of a #3 hoop and two crossties at 14 in
+    assert math.isclose(tie_weights[0, 0], 10 * 81.75 / 12 * 0.375)
+    # 10 sets of a #4 hoop, one crosstie along h and two along b for #11 bars
+    assert math.isclose(tie_weights[1, 0], 10 * 127.5 / 12 * 0.668)
+
+
+def test_calc_rebar_takeoff():
+    takeoff = rt.calc_rebar_takeoff(TEST_COLUMN_DATA, story_heights=STORY_HEIGHTS)
+    assert list(takeoff.stories) == ["Level 2", "Level 3"]
+    assert math.isclose(takeoff.vert_bar_weight[0, 0], 8 * 2.67 * 10)
+    assert math.isclose(takeoff.vert_bar_weight[1, 1], 12 * 5.313 * 12)
+
+    by_story = rt.takeoff_by_story(takeoff)
+    assert by_story.loc["Level 2", "columns"] == 2
+    assert math.isclose(
+        by_story.loc["Level 3", "total_weight"], takeoff.total_weight[:, 1].sum()
+    )
+
+    by_column = rt.takeoff_by_column(takeoff)
+    assert len(by_column) == 4
+    assert math.isclose(
+        by_column.loc[("Level 3", "B-1"), "tie_weight"], takeoff.tie_weight[1, 1]
+    )
+
+    tonnage = rt.calc_building_tonnage(takeoff)
+    assert math.isclose(tonnage["total"], by_column["total_weight"].sum() / 2000)
+
+
+def test_diff_takeoffs():
+    old = rt.calc_rebar_takeoff(TEST_COLUMN_DATA, story_heights=STORY_HEIGHTS)
+    new_data = dict(TEST_COLUMN_DATA, rebar=["8-#8", "12-#11", "8-#8", "12-#10"])
+    new = rt.calc_rebar_takeoff(new_data, story_heights=STORY_HEIGHTS)
+    diff = rt.diff_takeoffs(old, new)
+
+    assert diff.loc["Level 2", "change_tons"] < 0
+    assert math.isclose(
+        diff.loc["Total", "change_tons"],
+        rt.calc_building_tonnage(new)["total"] - rt.calc_building_tonnage(old)["total"],
+    )
@@ -0,0 +1,75 @@
+import numpy as np
+
+import column_stacks as cs
+import conc_columns
+import interaction_library as il
+import ram_column_schedule as rcs
+import synthetic_ram_export as sre
+
+
+def test_grid_label():
+    assert sre.grid_label(0) == "A"
+    assert sre.grid_label(25) == "Z"
+    assert sre.grid_label(26) == "AA"
+    assert sre.grid_label(701) == "ZZ"
+
+
+def test_pick_rebar():
+    assert sre.pick_rebar(12, 12, 0.01) == "4-#6"
+    assert sre.pick_rebar(24, 24, 0.02) == "20-#7"
+
+
+def test_generate_RAM_column_design_csv():
+    csv_text = sre.generate_RAM_column_design_csv(
+        n_stories=6, n_grid_x=3, n_grid_y=2, n_sizes=3, n_load_combos=2
+    )
+    raw_data = rcs.split_RAM_csv_lines(csv_text.splitlines())
+    column_data = rcs.extract_RAM_conc_column_data(raw_data)
+
+    assert all(len(v) == 6 * 3 * 2 for v in column_data.values())
+    assert column_data["level"][0] == "Level 7"
+    assert column_data["level"][-1] == "Level 2"
+    assert column_data["grid_loc"][:6] == ["A-1", "A-2", "B-1", "B-2", "C-1", "C-2"]
+    assert len(set(column_data["size"])) == 3
+    assert column_data["size"][0] == "12x12"
+
+    schedule = rcs.create_full_RAM_concrete_column_schedule(column_data)
+    assert schedule.shape == (6 * 8, 6)
+
+
+def test_generate_RAM_column_design_csv_is_repeatable():
+    assert sre.generate_RAM_column_design_csv(
+        seed=3
+    ) == sre.generate_RAM_column_design_csv(seed=3)
+    assert sre.generate_RAM_column_design_csv(
+        seed=3
+    ) != sre.generate_RAM_column_design_csv(seed=4)
+
+
+def test_generate_RAM_column_design_csv_loads():
+    csv_text = sre.generate_RAM_column_design_csv(n_load_combos=3)
+    column_data = rcs.extract_RAM_conc_column_data(
+        rcs.split_RAM_csv_lines(csv_text.splitlines())
+    )
+    demands = il.parse_column_demands(column_data)
+    phi_pn_max = 0.65 * conc_columns.calc_Pn(
+        demands["b"],
+        demands["h"],
+        demands["fpc"],
+        demands["n_bars"],
+        cs.BAR_AREA[demands["bar_idx"]],
+    )
+    # the loads follow the capacity of each column, not just its story
+    axial_util = demands["pu"] / phi_pn_max
+    assert 0 < axial_util.min() and axial_util.max() < 1.3
+    assert np.all(demands["mux"] > 0) and np.all(demands["muy"] > 0)
+
+    # each load combination has its own load factors
+    gravity_only = sre.generate_RAM_column_design_csv(n_load_combos=1)
+    combos = {line for line in gravity_only.splitlines() if "Combination" in line}
+    assert combos == {"Load Combination:.,1.4D"}
+    gravity_data = rcs.extract_RAM_conc_column_data(
+        rcs.split_RAM_csv_lines(gravity_only.splitlines())
+    )
+    assert gravity_data["size"] == column_data["size"]
+    assert gravity_data["pu"] != column_data["pu"]